@@ -1,10 +1,12 @@
 #!/usr/bin/env python
 u"""
 api.py
-Written by Tyler Sutterley (01/2025)
+Written by Tyler Sutterley (10/2026)
 Plotting tools for visualizing rioxarray variables on leaflet maps
 
 PYTHON DEPENDENCIES:
+    dask: Parallel computing with task scheduling
+        https://www.dask.org/
     geopandas: Python tools for geographic data
         http://geopandas.readthedocs.io/
     ipywidgets: interactive HTML widgets for Jupyter notebooks and IPython
@@ -14,11 +16,22 @@ PYTHON DEPENDENCIES:
     matplotlib: Python 2D plotting library
         http://matplotlib.org/
         https://github.com/matplotlib/matplotlib
+    numba: JIT compiler that translates Python code into machine code
+        https://numba.pydata.org/
+    numbagg: Fast N-dimensional aggregation functions with Numba
+        https://github.com/numbagg/numbagg
     numpy: Scientific Computing Tools For Python
         https://numpy.org
         https://numpy.org/doc/stable/user/numpy-for-matlab-users.html
+    orjson: Fast, correct Python JSON library
+        https://github.com/ijl/orjson
     OWSLib: Pythonic interface for Open Geospatial Consortium (OGC) web services
         https://owslib.readthedocs.io/
+    pillow: Python Imaging Library (fork)
+        https://python-pillow.org/
+    pyproj: Python interface to PROJ library
+        https://pypi.org/project/pyproj/
+        https://github.com/pyproj4/pyproj
     rasterio: Access to geospatial raster data
         https://github.com/rasterio/rasterio
         https://rasterio.readthedocs.io
@@ -28,6 +41,77 @@ PYTHON DEPENDENCIES:
         https://xyzservices.readthedocs.io/en/stable/
 
 UPDATE HISTORY:
+    Updated 10/2026: debounce cursor location updates using asyncio tasks
+        store drawn and added features by unique identifiers for fast removal
+        geometries is a read-only collection of the features on the map
+        output compact GeoJSON files using orjson if available
+        cache normalization percentiles for each variable and time lag
+        extract point time series with a single vectorized selection
+        encode map images directly with pillow rather than with pyplot
+        cache normalized color indices of images for reuse with colormaps
+        clip images using the source transform rather than padding
+        use multithreaded bilinear warping when downsampling images
+        debounce image updates on map boundary changes
+        reuse image layer and only redraw if the image url has changed
+        use coordinates of valid cells rather than full grids for transects
+        cache values of the selected dataset for finding clicked values
+        reuse a single matplotlib figure outside of pyplot for colorbars
+        use fast zlib compression levels when encoding png images
+        encode fully opaque map images as jpeg rather than png
+        use cached pyproj transformers for map bounds and clicked points
+        skip image updates if the map has moved by less than a pixel
+        wait for map bounds using a single persistent observer and event
+        use shallow copies of attributes when clipping images
+        cache the 8-bit lookup table for the current colormap
+        encode images in a background thread when updating map bounds
+        extract transect time series for all time steps at once
+        calculate regional averages for all time steps at once
+        cache indices of transect cells sorted by distance
+        calculate regional averages from the valid cells as dot products
+        use cached pyproj transformers for time series and transect geometries
+        extract transect values at valid cells without rechunking
+        calculate regional averages with numba-compiled kernel if available
+        load regional average values and areas in a single dask computation
+        output transect and regional average time series in single precision
+        cache indices and ice areas of valid cells for each geometry
+        short-circuit checks for empty masks and invalid data
+        cache contiguous grid coordinates for transect distances
+        format transect time labels as a single array operation
+        skip geometries that do not overlap the dataset before clipping
+        use column-major transect time series for plotting each time step
+        wrap longitudes using modular arithmetic
+        throttle cursor location updates and skip unchanged locations
+        store map resolutions as tuples and create default layout lazily
+        update map layers and controls once when adding or removing multiple
+        do not modify the properties of drawn objects when storing features
+        serialize numpy arrays when outputting GeoJSON files with orjson
+        use cached colormaps from the matplotlib colormap registry
+        import geopandas, owslib and pyplot only when first needed
+        reuse the image layer when replotting with the same configuration
+        read map origin and resolution once when calculating bounding boxes
+        cache WMS connections and basemap images for repeated plots
+        skip transforming geodataframes already in geographic coordinates
+        assign variable names directly without copying
+        set threads and memory limit for warping images as attributes
+        clip images without warping if at the map resolution and projection
+        keep normalized images for recently visited map bounds
+        transform clicked and selected points as scalars
+        include quantiles in the key of cached colorbar percentiles
+        check unset normalization bounds with None and exact comparisons
+        coalesce rapid widget changes before redrawing images
+        only warp the part of images within the map bounds
+        average blocks of pixels before warping to much coarser resolutions
+        share loaded values of the selected dataset between calculations
+        bundle change notifications when resetting map features
+        use builtin extrema for the geographic bounds of the map
+        get colorbar image bytes without rewinding the buffer
+        calculate centered image coordinates from affine parameters
+        extract transect values in order of distance from sorted indices
+        cache the grid cells within transect geometries
+        plot transects for each time with a single collection of lines
+        resample coarser images to the nearest pixels of the map grid
+        reject keyword arguments unsupported by transect line collections
+        rasterize geometries only within their bounding boxes
     Updated 01/2025: added more zoom levels and update max_zoom
         deprecation update for writing the crs to the dataset object
     Updated 06/2024: use wrapper to importlib for optional dependencies
@@ -53,8 +137,12 @@ import os
 import re
 import copy
 import json
+import time
+import uuid
+import functools
 import base64
 import asyncio
+import concurrent.futures
 import logging
 import numpy as np
 import collections.abc
@@ -63,12 +151,18 @@ from traitlets.utils.bunch import Bunch
 from IS2view.utilities import import_dependency
 
 # attempt imports
-gpd = import_dependency('geopandas')
+dask = import_dependency('dask')
 ipywidgets = import_dependency('ipywidgets')
 ipyleaflet = import_dependency('ipyleaflet')
-owslib = import_dependency('owslib')
-owslib.wms = import_dependency('owslib.wms')
+numba = import_dependency('numba')
+numbagg = import_dependency('numbagg')
+orjson = import_dependency('orjson')
+PIL = import_dependency('PIL')
+PIL.Image = import_dependency('PIL.Image')
+pyproj = import_dependency('pyproj')
 rio = import_dependency('rasterio')
+rio.crs = import_dependency('rasterio.crs')
+rio.features = import_dependency('rasterio.features')
 rio.transform = import_dependency('rasterio.transform')
 rio.warp = import_dependency('rasterio.warp')
 xr = import_dependency('xarray')
@@ -77,9 +171,12 @@ xyzservices = import_dependency('xyzservices')
 # attempt matplotlib imports
 try:
     import matplotlib
-    import matplotlib.cm as cm
+    import matplotlib.collections
     import matplotlib.colorbar
-    import matplotlib.pyplot as plt
+    import matplotlib.figure
+    import matplotlib.image
+    import matplotlib.lines
+    import matplotlib.backends.backend_agg
     import matplotlib.colors as colors
     matplotlib.rcParams['font.family'] = 'sans-serif'
     matplotlib.rcParams['font.sans-serif'] = ['Arial', 'Helvetica', 'DejaVu Sans']
@@ -90,6 +187,10 @@ except (AttributeError, ImportError, ModuleNotFoundError) as exc:
 # set environmental variable for anonymous s3 access
 os.environ['AWS_NO_SIGN_REQUEST'] = 'YES'
 
+# limits of normalization ranges for dynamic widgets
+_fmin = np.finfo(np.float64).min
+_fmax = np.finfo(np.float64).max
+
 # map projections
 projections = {}
 projections['EPSG:3857'] = dict(name='EPSG3857', custom=False),
@@ -99,7 +200,7 @@ projections['EPSG:3413'] = dict(
     proj4def="""+proj=stere +lat_0=90 +lat_ts=70 +lon_0=-45 +k=1 +x_0=0 +y_0=0
             +ellps=WGS84 +datum=WGS84 +units=m +no_defs""",
     origin=[-4194304, 4194304],
-    resolutions=[
+    resolutions=(
         16384.0,
         8192.0,
         4096.0,
@@ -115,7 +216,7 @@ projections['EPSG:3413'] = dict(
         4.0,
         2.0,
         1.0
-    ],
+    ),
     bounds=[
         [-4194304, -4194304],
         [4194304, 4194304]
@@ -127,7 +228,7 @@ projections['EPSG:3031'] = dict(
     proj4def="""+proj=stere +lat_0=-90 +lat_ts=-71 +lon_0=0 +k=1
         +x_0=0 +y_0=0 +datum=WGS84 +units=m +no_defs""",
     origin=[-4194304, 4194304],
-    resolutions=[
+    resolutions=(
         16384.0,
         8192.0,
         4096.0,
@@ -143,7 +244,7 @@ projections['EPSG:3031'] = dict(
         4.0,
         2.0,
         1.0
-    ],
+    ),
     bounds=[
         [-4194304, -4194304],
         [4194304, 4194304]
@@ -232,10 +333,134 @@ def _tile_provider(provider):
     except (NameError, AttributeError):
         pass
 
+def _area_weighted_sums(area, values, squared=False):
+    """Calculates area-weighted sums of valid values and the
+    total valid area for each time step
+    """
+    nt, npts = values.shape
+    weighted = np.empty((nt,), dtype=np.float64)
+    total = np.empty((nt,), dtype=np.float64)
+    for i in _prange(nt):
+        s = 0.0
+        a = 0.0
+        for j in range(npts):
+            # skip invalid cell areas
+            ai = area[i, j]
+            if (ai != ai):
+                continue
+            a += ai
+            # skip invalid values
+            v = values[i, j]
+            if (v != v):
+                continue
+            s += ai*v*v if squared else ai*v
+        weighted[i] = s
+        total[i] = a
+    return (weighted, total)
+
+# compile area-weighted sums with numba if available
+# (fast math flags exclude no-NaN assumptions for invalid checks)
+if hasattr(numba, 'njit'):
+    _prange = numba.prange
+    _area_weighted_sums = numba.njit(parallel=True, cache=True,
+        fastmath={'contract', 'reassoc'})(_area_weighted_sums)
+else:
+    _area_weighted_sums = None
+
+def _coordinates(coordinates):
+    """Yields each position from nested GeoJSON coordinates
+    """
+    if (np.ndim(coordinates[0]) == 0):
+        yield coordinates
+    else:
+        for c in coordinates:
+            yield from _coordinates(c)
+
+@functools.lru_cache(maxsize=32)
+def _transformer(source, target):
+    """Creates a cached pyproj Transformer object between
+    coordinate reference systems
+    """
+    return pyproj.Transformer.from_crs(source, target, always_xy=True)
+
+def _geometry_index(ds, geometry, crs):
+    """Get the indices of grid cells within a geometry
+
+    Only rasterizes the geometry within its bounding box
+
+    Parameters
+    ----------
+    ds : obj
+        ``xarray`` dataset or variable
+    geometry : dict
+        GeoJSON geometry
+    crs : str
+        coordinate reference system of geometry
+    """
+    # convert geometry to dataset coordinate reference system
+    if (rio.crs.CRS.from_user_input(crs) != ds.rio.crs):
+        geometry = rio.warp.transform_geom(crs, ds.rio.crs, geometry)
+    x, y = np.transpose(list(_coordinates(geometry['coordinates'])))
+    # get image indices of the geometry bounds from affine transform
+    # with a margin of pixels for rasterizing lines
+    transform = ds.rio.transform(recalc=True)
+    cols = (np.array([x.min(), x.max()]) - transform.c)/transform.a
+    rows = (np.array([y.min(), y.max()]) - transform.f)/transform.e
+    ny, nx = (ds.sizes['y'], ds.sizes['x'])
+    x0 = np.clip(int(np.floor(cols.min())) - 1, 0, nx)
+    x1 = np.clip(int(np.ceil(cols.max())) + 1, 0, nx)
+    y0 = np.clip(int(np.floor(rows.min())) - 1, 0, ny)
+    y1 = np.clip(int(np.ceil(rows.max())) + 1, 0, ny)
+    # return empty indices if the geometry is outside the grid
+    if (x1 <= x0) or (y1 <= y0):
+        return (np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp))
+    # rasterize the geometry within the bounding box
+    mask = rio.features.geometry_mask([geometry],
+        out_shape=(y1 - y0, x1 - x0),
+        transform=transform * transform.translation(x0, y0),
+        all_touched=False, invert=True)
+    ii, jj = np.nonzero(mask)
+    return (ii + y0, jj + x0)
+
+@functools.lru_cache(maxsize=None)
+def _named_colormap(name):
+    """Get a colormap from the matplotlib registry
+    """
+    return matplotlib.colormaps[name]
+
+@functools.lru_cache(maxsize=8)
+def _web_map_service(url, version='1.1.1'):
+    """Creates a cached OGC Web Map Service (WMS) connection
+    """
+    owslib_wms = import_dependency('owslib.wms')
+    return owslib_wms.WebMapService(url=url, version=version)
+
+@functools.lru_cache(maxsize=32)
+def _basemap_image(url, **kwargs):
+    """Requests and reads a cached image from a Web Map Service (WMS)
+    """
+    basemap = _web_map_service(url).getmap(**kwargs)
+    img = matplotlib.image.imread(io.BytesIO(basemap.read()))
+    # prevent modification of the cached image
+    img.setflags(write=False)
+    return img
+
+def _colormap(cmap):
+    """Get a cached colormap from a name or a ``Colormap`` object
+    """
+    if isinstance(cmap, colors.Colormap):
+        return cmap
+    return _named_colormap(cmap)
+
 # create traitlets of basemap providers
 basemaps = _load_dict(providers)
+
 # set default map dimensions
-_default_layout = ipywidgets.Layout(width='70%', height='600px')
+@functools.lru_cache(maxsize=None)
+def _default_layout():
+    """Creates the default ``ipywidgets.Layout`` when first needed
+    """
+    return ipywidgets.Layout(width='70%', height='600px')
 
 # draw ipyleaflet map
 class Leaflet:
@@ -284,11 +509,13 @@ class Leaflet:
         ``ipywidgets.Label`` with cursor location
     geometries : dict
         GeoJSON formatted geometries
+
+        Read-only collection of the drawn and added features
     """
     def __init__(self, projection, **kwargs):
         # set default keyword arguments
         kwargs.setdefault('map', None)
-        kwargs.setdefault('layout', _default_layout)
+        kwargs.setdefault('layout', _default_layout())
         kwargs.setdefault('attribution', False)
         kwargs.setdefault('full_screen_control', False)
         kwargs.setdefault('scale_control', False)
@@ -344,6 +571,9 @@ class Leaflet:
         # add control for cursor position
         if kwargs['cursor_control']:
             self.cursor = ipywidgets.Label()
+            self._cursor_task = None
+            self._cursor_key = None
+            self._cursor_time = 0.0
             cursor_control = ipyleaflet.WidgetControl(widget=self.cursor,
                 position='bottomleft')
             self.map.add(cursor_control)
@@ -384,11 +614,10 @@ class Leaflet:
                     showArea=True,
                     metric=['km', 'm']
                 )
-            # geojson feature collection
-            self.geometries = {}
-            self.geometries['type'] = 'FeatureCollection'
-            self.geometries['crs'] = 'epsg:4326'
-            self.geometries['features'] = []
+            # geojson features keyed by unique identifiers
+            # and identifiers of features with the same contents
+            self._features = {}
+            self._feature_ids = {}
             # add control to map
             draw_control.on_draw(self.handle_draw)
             self.map.add(draw_control)
@@ -400,29 +629,123 @@ class Leaflet:
         if (kwargs.get('type') == 'mousemove'):
             lat, lon = kwargs.get('coordinates')
             lon = self.wrap_longitudes(lon)
-            self.cursor.value = u"""Latitude: {d[0]:8.4f}\u00B0,
-                Longitude: {d[1]:8.4f}\u00B0""".format(d=[lat, lon])
+            # cancel any pending cursor update
+            if self._cursor_task is not None:
+                self._cursor_task.cancel()
+                self._cursor_task = None
+            # skip if location is unchanged at the displayed precision
+            if (self._cursor_key == (round(lat, 4), round(lon, 4))):
+                return
+            # time since the last label update
+            elapsed = time.monotonic() - self._cursor_time
+            # update label immediately if not within an event loop
+            # or if the label has not been recently updated
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError as exc:
+                self.set_cursor(lat, lon)
+            else:
+                if (elapsed >= 0.033):
+                    self.set_cursor(lat, lon)
+                else:
+                    self._cursor_task = loop.create_task(
+                        self.async_set_cursor(lat, lon, 0.033 - elapsed))
+
+    async def async_set_cursor(self, lat, lon, delay=0.016):
+        """debounced update of the cursor location label
+        """
+        await asyncio.sleep(delay)
+        self.set_cursor(lat, lon)
+
+    def set_cursor(self, lat, lon):
+        """set the cursor location label
+        """
+        self.cursor.value = u"""Latitude: {d[0]:8.4f}\u00B0,
+            Longitude: {d[1]:8.4f}\u00B0""".format(d=[lat, lon])
+        # save the displayed location and time of the update
+        self._cursor_key = (round(lat, 4), round(lon, 4))
+        self._cursor_time = time.monotonic()
 
     # keep track of objects drawn on map
     def handle_draw(self, obj, action, geo_json):
         """callback for handling draw events
         """
         # append geojson feature to list
-        feature = copy.copy(geo_json)
-        feature['properties'].pop('style')
+        # without modifying the style of the drawn object
+        properties = {k: v for k, v in geo_json.get('properties', {}).items()
+            if (k != 'style')}
+        feature = {**geo_json, 'properties': properties}
         if (action == 'created'):
-            self.geometries['features'].append(feature)
+            self.add_feature(feature)
         elif (action == 'deleted'):
-            self.geometries['features'].remove(feature)
+            self.remove_feature(feature)
         return self
 
+    @staticmethod
+    def _feature_key(feature):
+        """get a hashable key for the contents of a GeoJSON feature
+        """
+        return json.dumps(feature, sort_keys=True, default=str)
+
+    def add_feature(self, feature):
+        """add a GeoJSON feature to the list of geometries
+
+        Parameters
+        ----------
+        feature : dict
+            GeoJSON feature
+
+        Returns
+        -------
+        feature_id : str
+            unique identifier of the feature
+        """
+        # assign a unique identifier to the feature
+        feature_id = uuid.uuid4().hex
+        self._features[feature_id] = feature
+        key = self._feature_key(feature)
+        self._feature_ids.setdefault(key, []).append(feature_id)
+        return feature_id
+
+    def remove_feature(self, feature):
+        """remove a GeoJSON feature from the list of geometries
+
+        Only removes a single copy of features with the same contents
+
+        Parameters
+        ----------
+        feature : dict
+            GeoJSON feature
+        """
+        # find the identifiers of features with the same contents
+        key = self._feature_key(feature)
+        feature_ids = self._feature_ids.get(key)
+        if not feature_ids:
+            return
+        # remove the most recently added copy of the feature
+        feature_id = feature_ids.pop()
+        if not feature_ids:
+            self._feature_ids.pop(key)
+        self._features.pop(feature_id, None)
+
+    @property
+    def geometries(self):
+        """get the GeoJSON feature collection of geometries
+
+        The collection is generated from the features on the map,
+        and modifying the returned collection does not change them
+        """
+        geometries = {}
+        geometries['type'] = 'FeatureCollection'
+        geometries['crs'] = 'epsg:4326'
+        geometries['features'] = list(self._features.values())
+        return geometries
+
     # fix longitudes to be -180:180
     def wrap_longitudes(self, lon):
         """Fix longitudes to be within -180 and 180
         """
-        phi = np.arctan2(np.sin(lon*np.pi/180.0), np.cos(lon*np.pi/180.0))
-        # convert phi from radians to degrees
-        return phi*180.0/np.pi
+        return ((lon + 180.0) % 360.0) - 180.0
 
     # add a geopandas GeoDataFrame to map and list of geometries
     def add_geodataframe(self, gdf, **kwargs):
@@ -432,19 +755,29 @@ class Leaflet:
         ----------
         gdf : obj
             geopandas GeoDataFrame
+        tolerance : float or NoneType, default None
+            Tolerance in degrees for simplifying geometries
         kwargs : dict, default {}
             Keyword arguments for GeoJSON
         """
         # set default keyword arguments
         kwargs.setdefault('style', dict(color='blue'))
+        tolerance = kwargs.pop('tolerance', None)
         # convert geodataframe to coordinate reference system
-        # and to GeoJSON
-        geodata = gdf.to_crs('epsg:4326').__geo_interface__
+        # if not already in geographic coordinates (EPSG:4326)
+        if (gdf.crs is None) or (gdf.crs.to_epsg() != 4326):
+            gdf = gdf.to_crs('epsg:4326')
+        # simplify geometries for rendering on the map
+        if tolerance is not None:
+            gdf = gdf.set_geometry(gdf.geometry.simplify(tolerance))
+        # convert geodataframe to GeoJSON
+        geodata = gdf.__geo_interface__
         geojson = ipyleaflet.GeoJSON(data=geodata, **kwargs)
         # add features to map
         self.map.add(geojson)
         # add geometries to list of features
-        self.geometries['features'].extend(geodata['features'])
+        for feature in geodata['features']:
+            self.add_feature(feature)
         return self
 
     # output geometries to GeoJSON
@@ -458,27 +791,49 @@ class Leaflet:
         kwargs : dict, default {}
             Additional attributes for the GeoJSON file
         """
-        # dump the geometries to a geojson file
-        kwargs.update(self.geometries)
-        with open(filename, mode='w') as fid:
-            json.dump(kwargs, fid)
+        # dump the geometries to a compact geojson file
+        geojson = {**kwargs, **self.geometries}
+        try:
+            output = orjson.dumps(geojson,
+                option=orjson.OPT_SERIALIZE_NUMPY)
+        except AttributeError as exc:
+            output = json.dumps(geojson, separators=(',', ':')).encode('utf-8')
+        with open(filename, mode='wb') as fid:
+            fid.write(output)
         # print the filename and dictionary structure
         logging.info(filename)
-        logging.info(list(kwargs.keys()))
+        logging.info(list(geojson.keys()))
 
     def add(self, obj):
         """wrapper function for adding layers and controls to leaflet maps
         """
         if isinstance(obj, collections.abc.Iterable):
+            # current layers and controls on map
+            layers = list(self.map.layers)
+            controls = list(self.map.controls)
+            layer_ids = set(layer.model_id for layer in layers)
+            control_ids = set(control.model_id for control in controls)
+            # append objects that are not already on map
             for o in obj:
-                try:
-                    self.map.add(o)
-                except ipyleaflet.LayerException as exc:
-                    logging.info(f"{o} already on map")
-                    pass
-                except ipyleaflet.ControlException as exc:
-                    logging.info(f"{o} already on map")
-                    pass
+                if hasattr(o, 'as_leaflet_layer'):
+                    o = o.as_leaflet_layer()
+                if isinstance(o, ipyleaflet.Layer):
+                    if o.model_id in layer_ids:
+                        logging.info(f"{o} already on map")
+                        continue
+                    layer_ids.add(o.model_id)
+                    layers.append(o)
+                elif isinstance(o, ipyleaflet.Control):
+                    if o.model_id in control_ids:
+                        logging.info(f"{o} already on map")
+                        continue
+                    control_ids.add(o.model_id)
+                    controls.append(o)
+            # update the map layers and controls once
+            if (len(layers) != len(self.map.layers)):
+                self.map.layers = tuple(layers)
+            if (len(controls) != len(self.map.controls)):
+                self.map.controls = tuple(controls)
         else:
             try:
                 self.map.add(obj)
@@ -493,15 +848,29 @@ class Leaflet:
         """wrapper function for removing layers and controls to leaflet maps
         """
         if isinstance(obj, collections.abc.Iterable):
+            # current layers and controls on map
+            current = set(layer.model_id for layer in self.map.layers)
+            current.update(control.model_id for control in self.map.controls)
+            # layers and controls to remove from map
+            layer_ids = set()
+            control_ids = set()
             for o in obj:
-                try:
-                    self.map.remove(o)
-                except ipyleaflet.LayerException as exc:
+                if not isinstance(o, (ipyleaflet.Layer, ipyleaflet.Control)):
+                    continue
+                elif o.model_id not in current:
                     logging.info(f"{o} already removed from map")
-                    pass
-                except ipyleaflet.ControlException as exc:
-                    logging.info(f"{o} already removed from map")
-                    pass
+                elif isinstance(o, ipyleaflet.Layer):
+                    layer_ids.add(o.model_id)
+                else:
+                    control_ids.add(o.model_id)
+            # update the map layers and controls once
+            if layer_ids:
+                self.map.layers = tuple(layer for layer in self.map.layers
+                    if layer.model_id not in layer_ids)
+            if control_ids:
+                self.map.controls = tuple(control
+                    for control in self.map.controls
+                    if control.model_id not in control_ids)
         else:
             try:
                 self.map.remove(obj)
@@ -527,20 +896,20 @@ class Leaflet:
         kwargs.setdefault('layers', ['BlueMarble_NextGeneration'])
         kwargs.setdefault('format', 'image/png')
         kwargs.setdefault('srs', self.map.crs['name'])
+        # import pyplot when first creating figures
+        import matplotlib.pyplot as plt
         # create figure axis if non-existent
         if (ax is None):
             _, ax = plt.subplots()
         # get the pixel bounds and resolution of the map
         (left, top), (right, bottom) = self.map.pixel_bounds
         resolution = self.map.crs['resolutions'][int(self.map.zoom)]
+        origin_x, origin_y = self.map.crs['origin']
         # calculate the size of the map in pixels
-        kwargs.setdefault('size', [int((right-left)), int((bottom-top))])
+        kwargs.setdefault('size', (int(right - left), int(bottom - top)))
         # calculate the bounding box of the map in projected coordinates
-        bbox = [None]*4
-        bbox[0] = self.map.crs['origin'][0] + left*resolution
-        bbox[1] = self.map.crs['origin'][1] - bottom*resolution
-        bbox[2] = self.map.crs['origin'][0] + right*resolution
-        bbox[3] = self.map.crs['origin'][1] - top*resolution
+        bbox = [origin_x + left*resolution, origin_y - bottom*resolution,
+            origin_x + right*resolution, origin_y - top*resolution]
         kwargs.setdefault('bbox', bbox)
         # create WMS request for basemap image at bounds and resolution
         srs = kwargs['srs'].replace(':', '').lower()
@@ -548,10 +917,11 @@ class Leaflet:
         # https://wiki.earthdata.nasa.gov/display/GIBS
         # https://worldview.earthdata.nasa.gov/
         url = f'https://gibs.earthdata.nasa.gov/wms/{srs}/best/wms.cgi?'
-        wms = owslib.wms.WebMapService(url=url, version='1.1.1')
-        basemap = wms.getmap(**kwargs)
-        # read WMS layer and plot
-        img = plt.imread(io.BytesIO(basemap.read()))
+        # get cached WMS layer image or request and read image
+        kwargs = {k: tuple(v) if isinstance(v, list) else v
+            for k, v in kwargs.items()}
+        img = _basemap_image(url, **kwargs)
+        # plot WMS layer image
         ax.imshow(img, extent=[bbox[0],bbox[2],bbox[1],bbox[3]])
 
     # plot geometries
@@ -569,11 +939,14 @@ class Leaflet:
         # return if no geometries
         if (len(self.geometries['features']) == 0):
             return
+        # import pyplot when first creating figures
+        import matplotlib.pyplot as plt
         # create figure axis if non-existent
         if (ax is None):
             _, ax = plt.subplots()
         # create a geopandas GeoDataFrame from the geometries
         # convert coordinate reference system to map crs
+        gpd = import_dependency('geopandas')
         gdf = gpd.GeoDataFrame.from_features(self.geometries,
             crs=self.geometries['crs']).to_crs(self.crs)
         # create plot with all geometries
@@ -692,30 +1065,81 @@ class LeafletMap(HasTraits):
         Variable value at clicked location
     _units : str
         Units of selected variable
+    num_threads : int
+        Number of threads for warping images
+    warp_mem_limit : int
+        Working memory limit in MB for warping images
     """
 
     bounds = Tuple(Tuple(Float(), Float()), Tuple(Float(), Float()))
+    # reusable matplotlib figure for creating colorbars
+    _colorbar_figure = None
+    _colorbar_base = None
+    # background thread for encoding images
+    _executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
     @observe('bounds')
     def boundary_change(self, change):
         """Update image on boundary change
         """
-        # add image object to map
-        if self._image is not None:
-            # attempt to remove layer
-            self.remove(self._image)
-            # create new image service layer
-            self._image = ipyleaflet.ImageService(
-                name=self._variable,
-                crs=self.crs,
-                interactive=True,
-                update_interval=100,
-                endpoint='local')
-        # add click handler for popups
-        if self.enable_popups:
-            self._image.on_click(self.handle_click)
-        # set the image url
-        self.set_image_url()
-        self.add(self._image)
+        # cancel any pending image updates
+        if self._bounds_task is not None:
+            self._bounds_task.cancel()
+            self._bounds_task = None
+        # coalesce rapid changes during panning and zooming
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.update_image()
+        else:
+            self._bounds_task = loop.create_task(self.async_update_image())
+
+    def check_bounds(self):
+        """Check if the image needs to be updated for the current map bounds
+        """
+        # verify that the image layer exists
+        if self._image is None:
+            return False
+        # update the bounds of the map
+        self.get_bounds()
+        # skip rendering if the map has moved by less than a pixel
+        if self._rendered_bounds is not None:
+            zoom, *pixel_bounds = self._rendered_bounds
+            offset = np.subtract(pixel_bounds,
+                (self.left, self.top, self.right, self.bottom))
+            if (zoom == self.z) and np.all(np.abs(offset) < 1):
+                return False
+        return True
+
+    def update_image(self):
+        """Update image for the current map bounds
+        """
+        if not self.check_bounds():
+            return
+        self.get_image_url()
+        self.refresh_image()
+
+    async def async_update_image(self, delay=0.2):
+        """Update image for the current map bounds after a delay,
+        encoding the image in a background thread
+        """
+        await asyncio.sleep(delay)
+        if not self.check_bounds():
+            return
+        # render the image and save the zoom level and pixel bounds
+        self._image_version += 1
+        version = self._image_version
+        rgba = self.get_image_rgba()
+        rendered_bounds = (self.z, self.left, self.top, self.right, self.bottom)
+        # encode the image while allowing the next render to start
+        loop = asyncio.get_running_loop()
+        url = await loop.run_in_executor(LeafletMap._executor,
+            self.encode_image, rgba)
+        # discard the image if it was rendered again while encoding
+        if (version != self._image_version):
+            return
+        self.url = url
+        self._rendered_bounds = rendered_bounds
+        self.refresh_image()
 
     def __init__(self, ds):
         # initialize map
@@ -731,13 +1155,35 @@ class LeafletMap(HasTraits):
         self._variable = None
         # initialize image and colorbars
         self._image = None
+        self._image_key = None
         self.cmap = None
         self.norm = None
         self.opacity = None
         self._colorbar = None
+        # event and task for pending image updates
+        self._bounds_event = None
+        self._bounds_task = None
+        self._rendered_bounds = None
+        # counter of rendered images for discarding stale updates
+        self._image_version = 0
+        # task and flags for pending widget redraws
+        self._redraw_task = None
+        self._redraw_colorbar = False
+        self._redraw_norm = False
+        # cache of normalization percentiles for variables and lags
+        self._clim_cache = {}
+        # cache of normalized color indices for recent map bounds
+        self._indexed_cache = {}
+        # cache of the 8-bit lookup table for the colormap
+        self._lut = None
+        # threads and memory limit for warping images
+        self.num_threads = max(1, os.cpu_count() or 1)
+        self.warp_mem_limit = 256
         # initialize attributes for popup
         self.enable_popups = False
         self._popup = None
+        self._values = None
+        self._values_source = None
         self._data = None
         self._units = None
 
@@ -788,7 +1234,7 @@ class LeafletMap(HasTraits):
         # enable contextual popups
         self.enable_popups = bool(kwargs['enable_popups'])
         # reduce to variable and lag
-        self._variable = copy.copy(kwargs['variable'])
+        self._variable = kwargs['variable']
         self.lag = int(kwargs['lag'])
         # select data variable
         self.set_dataset()
@@ -798,22 +1244,17 @@ class LeafletMap(HasTraits):
         if kwargs['norm'] is None:
             self.norm = colors.Normalize(vmin=self.vmin, vmax=self.vmax, clip=True)
         else:
+            # copy as the limits are updated by the map widgets
             self.norm = copy.copy(kwargs['norm'])
         # get colormap
-        self.cmap = copy.copy(cm.get_cmap(kwargs['cmap']))
+        self.cmap = _colormap(kwargs['cmap'])
         # get opacity
         self.opacity = float(kwargs['opacity'])
         # wait for changes
+        self._bounds_event = asyncio.Event()
+        self.map.observe(self.set_bounds_event, names='bounds')
         asyncio.ensure_future(self.async_wait_for_bounds())
-        self._image = ipyleaflet.ImageService(
-            name=self._variable,
-            crs=self.crs,
-            interactive=True,
-            update_interval=100,
-            endpoint='local')
-        # add click handler for popups
-        if self.enable_popups:
-            self._image.on_click(self.handle_click)
+        self.get_image_service()
         # set the image url
         self.set_image_url()
         # add image object to map
@@ -830,6 +1271,29 @@ class LeafletMap(HasTraits):
                 position=self.colorbar_position
             )
 
+    def get_image_service(self):
+        """get the image service layer for the dataset
+        """
+        # reuse the image layer if the configuration is unchanged
+        key = (self.crs['name'], self.enable_popups)
+        if (self._image is not None) and (self._image_key == key):
+            self._image.name = self._variable
+            return self._image
+        # remove any previous image layer from the map
+        if self._image is not None:
+            self.remove(self._image)
+        self._image = ipyleaflet.ImageService(
+            name=self._variable,
+            crs=self.crs,
+            interactive=True,
+            update_interval=100,
+            endpoint='local')
+        # add click handler for popups
+        if self.enable_popups:
+            self._image.on_click(self.handle_click)
+        self._image_key = key
+        return self._image
+
     def wait_for_change(self, widget, value):
         future = asyncio.Future()
         def get_value(change):
@@ -838,13 +1302,24 @@ class LeafletMap(HasTraits):
         widget.observe(get_value, value)
         return future
 
+    def set_bounds_event(self, change):
+        """set the event for changes in map bounds
+        """
+        self._bounds_event.set()
+
+    async def async_wait_for_bounds_event(self):
+        """wait for and reset the event for changes in map bounds
+        """
+        await self._bounds_event.wait()
+        self._bounds_event.clear()
+
     async def async_wait_for_bounds(self):
         if len(self.map.bounds) == 0:
-            await self.wait_for_change(self.map, 'bounds')
+            await self.async_wait_for_bounds_event()
         # check that bounds are close
         while True:
             self.get_bounds()
-            await self.wait_for_change(self.map, 'bounds')
+            await self.async_wait_for_bounds_event()
             if np.isclose(self.bounds, self.map.bounds).all():
                 break
         # will update map
@@ -888,18 +1363,26 @@ class LeafletMap(HasTraits):
     def reset(self):
         """remove features from leaflet map
         """
+        # find image layers, popups and colorbars on the map
+        features = []
         for layer in self.map.layers:
             if (layer._model_name == 'LeafletImageServiceModel') and \
                 (layer.endpoint == 'local'):
-                self.remove(layer)
+                features.append(layer)
             elif (layer._model_name == 'LeafletPopupModel'):
-                self.remove(layer)
+                features.append(layer)
         for control in self.map.controls:
             if (control._model_name == 'LeafletWidgetControlModel') and \
                 (control.widget._model_name == 'ImageModel'):
-                self.remove(control)
-        # reset layers and controls
+                features.append(control)
+        # bundle change notifications to synchronize map once
+        with self.map.hold_trait_notifications():
+            for feature in features:
+                self.remove(feature)
+        # reset layers, controls and cached images
+        self._indexed_cache.clear()
         self._image = None
+        self._image_key = None
         self._popup = None
         self._colorbar = None
 
@@ -909,10 +1392,12 @@ class LeafletMap(HasTraits):
         """
         # get SW and NE corners in map coordinates
         (self.left, self.top), (self.right, self.bottom) = self.map.pixel_bounds
-        self.sw = dict(x=(self.map.crs['origin'][0] + self.left*self.resolution),
-            y=(self.map.crs['origin'][1] - self.bottom*self.resolution))
-        self.ne = dict(x=(self.map.crs['origin'][0] + self.right*self.resolution),
-            y=(self.map.crs['origin'][1] - self.top*self.resolution))
+        resolution = self.resolution
+        origin_x, origin_y = self.map.crs['origin']
+        self.sw = dict(x=(origin_x + self.left*resolution),
+            y=(origin_y - self.bottom*resolution))
+        self.ne = dict(x=(origin_x + self.right*resolution),
+            y=(origin_y - self.top*resolution))
         return self
 
     # get map bounds in geographic coordinates
@@ -920,18 +1405,28 @@ class LeafletMap(HasTraits):
         """get the bounds of the leaflet map in geographical coordinates
         """
         self.get_bbox()
-        lon, lat = rio.warp.transform(
-            self.crs['name'], 'EPSG:4326',
+        transformer = self.get_transformer(self.crs['name'], 'EPSG:4326')
+        lon, lat = transformer.transform(
             [self.sw['x'], self.ne['x']],
             [self.sw['y'], self.ne['y']])
         # calculate bounds in latitude/longitude
-        north = np.max(lat)
-        east = np.max(lon)
-        south = np.min(lat)
-        west = np.min(lon)
+        south, north = (min(lat), max(lat))
+        west, east = (min(lon), max(lon))
         # update bounds
         self.bounds = ((south, west), (north, east))
 
+    def get_transformer(self, source, target):
+        """get a cached transformer between coordinate reference systems
+
+        Parameters
+        ----------
+        source : str
+            Coordinate Reference System of input coordinates
+        target : str
+            Coordinate Reference System of output coordinates
+        """
+        return _transformer(str(source), str(target))
+
     def get_crs(self):
         """Attempt to get the coordinate reference system of the dataset
         """
@@ -971,40 +1466,69 @@ class LeafletMap(HasTraits):
         kwargs.setdefault('vmax', None)
         # set colorbar limits to 2-98 percentile
         # if not using a defined plot range
-        clim = self._ds_selected.chunk(dict(y=-1,x=-1)).quantile((0.02, 0.98)).values
+        clim = self.get_clim()
         # set minimum for normalization
-        fmin = np.finfo(np.float64).min
-        if (kwargs['vmin'] is None) or np.isclose(kwargs['vmin'], fmin):
+        if (kwargs['vmin'] is None) or (kwargs['vmin'] <= _fmin):
             self.vmin = clim[0]
             self._dynamic = True
         else:
             self.vmin = np.copy(kwargs['vmin'])
             self._dynamic = False
         # set maximum for normalization
-        fmax = np.finfo(np.float64).max
-        if (kwargs['vmax'] is None) or np.isclose(kwargs['vmax'], fmax):
+        if (kwargs['vmax'] is None) or (kwargs['vmax'] >= _fmax):
             self.vmax = clim[-1]
             self._dynamic = True
         else:
             self.vmax = np.copy(kwargs['vmax'])
             self._dynamic = False
 
+    def get_clim(self, quantiles=(0.02, 0.98), max_samples=2**22):
+        """
+        Get the percentiles of the selected dataset for the
+        colorbar normalization
+
+        Parameters
+        ----------
+        quantiles : tuple, default (0.02, 0.98)
+            Quantiles to calculate
+        max_samples : int, default 2**22
+            Maximum number of values to use when calculating quantiles
+        """
+        # check if the percentiles have already been calculated
+        key = (self._variable, self.lag, tuple(quantiles))
+        if key in self._clim_cache:
+            return self._clim_cache[key]
+        # subsample very large images with a constant stride
+        # (sharing the loaded values with clipped images and popups)
+        values = np.ravel(self.get_values())
+        stride = max(1, int(np.ceil(values.size/max_samples)))
+        values = values[::stride]
+        # calculate percentiles using parallelized numbagg if available
+        try:
+            clim = numbagg.nanquantile(values, quantiles)
+        except Exception as exc:
+            clim = np.nanquantile(values, quantiles)
+        # save percentiles to cache
+        self._clim_cache[key] = np.asarray(clim)
+        return self._clim_cache[key]
+
     def validate_norm(self):
         """
         Validate the colorbar normalization bounds
         """
-        fmin = np.finfo(np.float64).min
-        fmax = np.finfo(np.float64).max
-        if np.isclose(self.vmin, fmin):
+        if (self.vmin is None) or (self.vmin <= _fmin):
             self.vmin = -5
             self._dynamic = False
-        if np.isclose(self.vmax, fmax):
+        if (self.vmax is None) or (self.vmax >= _fmax):
             self.vmax = 5
             self._dynamic = False
 
     def clip_image(self, ds):
         """clip or warp xarray image to bounds of leaflet map
         """
+        # use the loaded values of the selected dataset if available
+        if (ds is self._ds_selected) and (self._values_source is ds):
+            ds = ds.transpose(..., 'y', 'x').copy(data=self._values)
         self.get_bbox()
         # attempt to get the coordinate reference system of the dataset
         self.get_crs()
@@ -1017,75 +1541,201 @@ class LeafletMap(HasTraits):
         self.extent = np.array([minx, maxx, miny, maxy])
         # compare data resolution and leaflet map resolution
         resolution = np.abs(ds.x[1] - ds.x[0]).values
-        if (resolution > self.resolution):
-            # pad input image to map bounds
-            padded = ds.rio.pad_box(minx=minx, maxx=maxx, miny=miny, maxy=maxy)
-            # get affine transform of padded image
-            pad_transform = padded.rio.transform()
-            north = int((maxy - pad_transform.f)//pad_transform.e)
-            east = int((maxx - pad_transform.c)//pad_transform.a) + 1
-            south = int((miny - pad_transform.f)//pad_transform.e) + 1
-            west = int((minx - pad_transform.c)//pad_transform.a)
-            # clip image to map bounds
-            return padded.isel(x=slice(west, east), y=slice(north, south))
+        # no warping needed for images at the map resolution and projection
+        equivalent = np.isclose(resolution, self.resolution) and \
+            (self._ds.rio.crs == self.crs['name'])
+        if (resolution > self.resolution) or equivalent:
+            # output affine transformation and dimensions of map image
+            dst_transform = rio.transform.from_origin(minx, maxy,
+                self.resolution, self.resolution)
+            dst_width = int(np.round((maxx - minx)/self.resolution))
+            dst_height = int(np.round((maxy - miny)/self.resolution))
+            # calculate centered coordinates of map pixels
+            x_coords = dst_transform.c + dst_transform.a*(np.arange(dst_width) + 0.5)
+            y_coords = dst_transform.f + dst_transform.e*(np.arange(dst_height) + 0.5)
+            # get image indices of the nearest source pixel
+            # to the center of each map pixel
+            src_transform = ds.rio.transform()
+            cols = np.floor((x_coords - src_transform.c)/src_transform.a).astype(int)
+            rows = np.floor((y_coords - src_transform.f)/src_transform.e).astype(int)
+            ny, nx = (ds.sizes['y'], ds.sizes['x'])
+            valid_cols = (cols >= 0) & (cols < nx)
+            valid_rows = (rows >= 0) & (rows < ny)
+            # allocate for output resampled image
+            dtype = np.promote_types(ds.dtype, np.float32)
+            dst_data = np.full((dst_height, dst_width), np.nan, dtype=dtype)
+            # resample image if overlapping the map
+            if valid_cols.any() and valid_rows.any():
+                # only read the part of the image within the map bounds
+                x0, x1 = (cols[valid_cols].min(), cols[valid_cols].max() + 1)
+                y0, y1 = (rows[valid_rows].min(), rows[valid_rows].max() + 1)
+                clipped = ds.isel(x=slice(x0, x1), y=slice(y0, y1)).values
+                ii = rows[valid_rows] - y0
+                jj = cols[valid_cols] - x0
+                dst_data[np.ix_(valid_rows, valid_cols)] = clipped[np.ix_(ii, jj)]
+            # return DataAarray with resampled image
+            return xr.DataArray(
+                name=ds.name,
+                data=dst_data,
+                coords=dict(y=y_coords, x=x_coords),
+                dims=('y', 'x'),
+                attrs=dict(ds.attrs),
+            )
         else:
+            # integer factor between map and data resolutions
+            factor = int(self.resolution//resolution)
+            # get image indices of map bounds from affine transform
+            # with a margin of pixels for resampling
+            src_transform = ds.rio.transform()
+            margin = 2*max(1, factor)
+            cols = (np.array([minx, maxx]) - src_transform.c)/src_transform.a
+            rows = (np.array([maxy, miny]) - src_transform.f)/src_transform.e
+            ny, nx = (ds.sizes['y'], ds.sizes['x'])
+            x0 = np.clip(int(np.floor(cols.min())) - margin, 0, nx)
+            x1 = np.clip(int(np.ceil(cols.max())) + margin, 0, nx)
+            y0 = np.clip(int(np.floor(rows.min())) - margin, 0, ny)
+            y1 = np.clip(int(np.ceil(rows.max())) + margin, 0, ny)
+            # only warp the part of the image within the map bounds
+            ds = ds.isel(x=slice(x0, x1), y=slice(y0, y1))
+            src_transform = src_transform * src_transform.translation(x0, y0)
+            # average blocks of pixels if the map resolution is much coarser
+            if (factor >= 2) and (min(ds.sizes['x'], ds.sizes['y']) >= factor):
+                ds = ds.coarsen(x=factor, y=factor, boundary='trim').mean()
+                src_transform = src_transform * src_transform.scale(factor)
             # warp image to map bounds and resolution
             # input and output affine transformations
-            src_transform = ds.rio.transform()
             dst_transform = rio.transform.from_origin(minx, maxy,
                 self.resolution, self.resolution)
             # allocate for output warped image
             dst_width = int((maxx - minx)//self.resolution)
             dst_height = int((maxy - miny)//self.resolution)
-            dst_data = np.zeros((dst_height, dst_width), dtype=ds.dtype.type)
-            # warp image to output resolution
-            rio.warp.reproject(source=ds.values, destination=dst_data,
-                src_transform=src_transform,
-                src_crs=self._ds.rio.crs,
-                src_nodata=np.nan,
-                dst_transform=dst_transform,
-                dst_crs=self.crs['name'],
-                dst_resolution=(self.resolution, self.resolution))
+            dtype = np.promote_types(ds.dtype, np.float32)
+            dst_data = np.full((dst_height, dst_width), np.nan, dtype=dtype)
+            # warp image to output resolution if overlapping the map
+            if (ds.sizes['x'] >= 2) and (ds.sizes['y'] >= 2):
+                rio.warp.reproject(source=ds.values, destination=dst_data,
+                    src_transform=src_transform,
+                    src_crs=self._ds.rio.crs,
+                    src_nodata=np.nan,
+                    dst_transform=dst_transform,
+                    dst_crs=self.crs['name'],
+                    dst_resolution=(self.resolution, self.resolution),
+                    resampling=rio.warp.Resampling.bilinear,
+                    num_threads=self.num_threads,
+                    warp_mem_limit=self.warp_mem_limit)
             # calculate centered coordinates
-            transform = dst_transform * dst_transform.translation(0.5, 0.5)
-            x_coords, _ = transform * (np.arange(dst_width), np.zeros(dst_width))
-            _, y_coords = transform * (np.zeros(dst_height), np.arange(dst_height))
+            x_coords = dst_transform.c + dst_transform.a*(np.arange(dst_width) + 0.5)
+            y_coords = dst_transform.f + dst_transform.e*(np.arange(dst_height) + 0.5)
             # return DataAarray with warped image
             return xr.DataArray(
                 name=ds.name,
                 data=dst_data,
                 coords=dict(y=y_coords, x=x_coords),
-                dims=copy.deepcopy(ds.dims),
-                attrs=copy.deepcopy(ds.attrs),
+                dims=('y', 'x'),
+                attrs=dict(ds.attrs),
             )
 
-    def get_image_url(self):
-        """create the image url for the imageservice
+    def get_image_index(self, maxsize=16):
+        """get the normalized colormap indices of the image
+        clipped to the bounds of the leaflet map
+
+        Parameters
+        ----------
+        maxsize: int, default 16
+            Maximum number of recently used images to cache
         """
-        fig, ax = plt.subplots(1, figsize=(15, 8))
-        fig.subplots_adjust(left=0, right=1, bottom=0, top=1)
+        # check if the image has already been normalized
+        # for the map bounds, variable and normalization
+        bounds = (self.z, tuple(map(tuple, self.map.pixel_bounds)))
+        key = (bounds, self._variable, self.lag, self.cmap.N,
+            id(self.norm), self.norm.vmin, self.norm.vmax)
+        if key in self._indexed_cache:
+            # move to the end of the cache as most recently used
+            indices = self._indexed_cache.pop(key)
+            self._indexed_cache[key] = indices
+            return indices
+        # clip image to map bounds
         visible = self.clip_image(self._ds_selected)
-        visible.plot.imshow(ax=ax,
-            norm=self.norm,
-            interpolation="nearest",
-            cmap=self.cmap,
-            alpha=self.opacity,
-            add_colorbar=False,
-            add_labels=False
-        )
-        # set image extent
-        ax.set_xlim(self.extent[0], self.extent[1])
-        ax.set_ylim(self.extent[2], self.extent[3])
-        ax.axis("tight")
-        ax.axis("off")
-        # save as in-memory png
+        # verify that the image is oriented north-up
+        if (visible.y[0] < visible.y[-1]):
+            visible = visible.isel(y=slice(None, None, -1))
+        # normalize image and scale to colormap indices
+        # following the conventions of matplotlib colormaps
+        # (N: under range, N+1: over range, N+2: invalid)
+        N = self.cmap.N
+        normalized = self.norm(visible.values)
+        invalid = np.ma.getmaskarray(normalized) | np.isnan(normalized)
+        xa = np.ma.getdata(normalized).astype(np.float64)*N
+        xa[xa == N] = N - 1
+        with np.errstate(invalid='ignore'):
+            under = (xa < 0)
+            over = (xa >= N)
+            indices = xa.astype(np.uint16)
+        indices[under] = N
+        indices[over] = N + 1
+        indices[invalid] = N + 2
+        # save indices to cache and remove least recently used
+        self._indexed_cache[key] = indices
+        while (len(self._indexed_cache) > maxsize):
+            self._indexed_cache.pop(next(iter(self._indexed_cache)))
+        return indices
+
+    def get_lut(self):
+        """get the 8-bit RGBA lookup table for the colormap
+        """
+        # use cached lookup table if colormap and opacity are unchanged
+        key = (self.cmap, self.opacity)
+        if (self._lut is not None) and (self._lut[0] == key):
+            return self._lut[1]
+        N = self.cmap.N
+        kwargs = dict(alpha=self.opacity, bytes=True)
+        # colors within, under and over the normalization range
+        lut = self.cmap(np.arange(-1, N + 1), **kwargs)
+        # color for invalid points
+        bad = self.cmap(np.ma.masked_invalid([np.nan]), **kwargs)
+        lut = np.concatenate((lut[1:-1], lut[:1], lut[-1:], bad), axis=0)
+        self._lut = (key, lut)
+        return lut
+
+    def get_image_rgba(self):
+        """get the 8-bit RGBA image for the current map bounds
+        """
+        # convert normalized image to 8-bit RGBA colors
+        return self.get_lut().take(self.get_image_index(), axis=0)
+
+    @staticmethod
+    def encode_image(rgba):
+        """encode an 8-bit RGBA image as a base64 data url
+
+        Parameters
+        ----------
+        rgba : np.ndarray
+            8-bit RGBA image
+        """
+        # save as in-memory image
         png = io.BytesIO()
-        plt.savefig(png, format='png', transparent=True)
-        plt.close()
-        png.seek(0)
-        # encode to base64 and get url
-        data = base64.b64encode(png.read()).decode("ascii")
-        self.url = "data:image/png;base64," + data
+        if np.all(rgba[..., 3] == 255):
+            # use jpeg for fully opaque images
+            PIL.Image.fromarray(rgba[..., :3]).save(png, format='JPEG',
+                quality=85)
+            mimetype = 'image/jpeg'
+        else:
+            # use png for images with transparency
+            PIL.Image.fromarray(rgba).save(png, format='PNG',
+                compress_level=1, optimize=False)
+            mimetype = 'image/png'
+        # encode to base64 without copying the buffer and get url
+        data = base64.b64encode(png.getbuffer()).decode("ascii")
+        return f"data:{mimetype};base64," + data
+
+    def get_image_url(self):
+        """create the image url for the imageservice
+        """
+        self._image_version += 1
+        self.url = self.encode_image(self.get_image_rgba())
+        # save the zoom level and pixel bounds of the image
+        self._rendered_bounds = (self.z, self.left, self.top,
+            self.right, self.bottom)
         return self
 
     def set_image_url(self, *args, **kwargs):
@@ -1105,11 +1755,69 @@ class LeafletMap(HasTraits):
         except Exception as exc:
             pass
         else:
-            # update image url
-            self._image.url = self.url
-            # force redrawing of map by removing and adding layer
-            self.remove(self._image)
-            self.add(self._image)
+            self.refresh_image()
+
+    def refresh_image(self):
+        """
+        Update the url of the image on the map
+        """
+        # skip redrawing if the image has not changed
+        if (self._image.url == self.url):
+            return
+        # update image url
+        self._image.url = self.url
+        # force redrawing of map by removing and adding layer
+        # as the frontend only reads the url when creating the layer
+        self.remove(self._image)
+        self.add(self._image)
+
+    def debounce_redraw(self, colorbar=True, norm=False):
+        """
+        Coalesce rapid widget changes before redrawing
+        the image and colorbar on the map
+
+        Parameters
+        ----------
+        colorbar : bool, default True
+            Redraw the colorbar
+        norm : bool, default False
+            Update the dynamic normalization bounds
+        """
+        # cancel any pending redraws
+        if self._redraw_task is not None:
+            self._redraw_task.cancel()
+            self._redraw_task = None
+        self._redraw_colorbar |= colorbar
+        self._redraw_norm |= norm
+        # redraw immediately if not within an event loop
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.redraw_pending()
+        else:
+            self._redraw_task = loop.create_task(self.async_redraw_pending())
+
+    def redraw_pending(self):
+        """
+        Redraw the image and, if requested, the colorbar on the map
+        """
+        colorbar, self._redraw_colorbar = (self._redraw_colorbar, False)
+        norm, self._redraw_norm = (self._redraw_norm, False)
+        # check if dynamic normalization is enabled
+        if norm and self._dynamic:
+            self.get_norm_bounds()
+            self.norm.vmin = self.vmin
+            self.norm.vmax = self.vmax
+        self.redraw()
+        if colorbar:
+            self.redraw_colorbar()
+
+    async def async_redraw_pending(self, delay=0.15):
+        """
+        Redraw the image and colorbar on the map after a delay
+        """
+        await asyncio.sleep(delay)
+        self.redraw_pending()
 
     def redraw_colorbar(self, *args, **kwargs):
         """
@@ -1169,6 +1877,16 @@ class LeafletMap(HasTraits):
         else:
             self._ds_selected = self._ds[self._variable]
 
+    def get_values(self):
+        """get the values of the selected dataset as a contiguous array
+        """
+        # load values if the selected dataset has changed
+        if self._values_source is not self._ds_selected:
+            self._values = np.ascontiguousarray(
+                self._ds_selected.transpose(..., 'y', 'x').values)
+            self._values_source = self._ds_selected
+        return self._values
+
     def set_variable(self, sender):
         """update the plotted variable
         """
@@ -1179,14 +1897,8 @@ class LeafletMap(HasTraits):
             return
         # reduce to variable and lag
         self.set_dataset()
-        # check if dynamic normalization is enabled
-        if self._dynamic:
-            self.get_norm_bounds()
-            self.norm.vmin = self.vmin
-            self.norm.vmax = self.vmax
         # try to redraw the selected dataset
-        self.redraw()
-        self.redraw_colorbar()
+        self.debounce_redraw(norm=True)
 
     def set_lag(self, sender):
         """update the time lag for the selected variable
@@ -1197,16 +1909,9 @@ class LeafletMap(HasTraits):
         else:
             return
         # try to update the selected dataset
-        self._ds_selected = self._ds[self._variable].sel(time=self._ds.time[self.lag])
-        # check if dynamic normalization is enabled
-        if self._dynamic:
-            self.get_norm_bounds()
-            self.norm.vmin = self.vmin
-            self.norm.vmax = self.vmax
+        self.set_dataset()
         # try to redraw the selected dataset
-        self.redraw()
-        if self._dynamic:
-            self.redraw_colorbar()
+        self.debounce_redraw(colorbar=self._dynamic, norm=True)
 
     def set_dynamic(self, sender):
         """set dynamic normalization for the selected variable
@@ -1225,8 +1930,7 @@ class LeafletMap(HasTraits):
         self.norm.vmin = self.vmin
         self.norm.vmax = self.vmax
         # try to redraw the selected dataset
-        self.redraw()
-        self.redraw_colorbar()
+        self.debounce_redraw()
 
     def set_norm(self, sender):
         """update the normalization for the selected variable
@@ -1241,8 +1945,7 @@ class LeafletMap(HasTraits):
         self.norm.vmin = self.vmin
         self.norm.vmax = self.vmax
         # try to redraw the selected dataset
-        self.redraw()
-        self.redraw_colorbar()
+        self.debounce_redraw()
 
     def set_colormap(self, sender):
         """update the colormap for the selected variable
@@ -1251,16 +1954,15 @@ class LeafletMap(HasTraits):
         if isinstance(sender['new'], str):
             cmap_name = self.cmap.name
             cmap_reverse_flag = '_r' if cmap_name.endswith('_r') else ''
-            self.cmap = cm.get_cmap(sender['new'] + cmap_reverse_flag)
+            self.cmap = _colormap(sender['new'] + cmap_reverse_flag)
         elif isinstance(sender['new'], bool):
             cmap_name = self.cmap.name.strip('_r')
             cmap_reverse_flag = '_r' if sender['new'] else ''
-            self.cmap = cm.get_cmap(cmap_name + cmap_reverse_flag)
+            self.cmap = _colormap(cmap_name + cmap_reverse_flag)
         else:
             return
         # try to redraw the selected dataset
-        self.redraw()
-        self.redraw_colorbar()
+        self.debounce_redraw()
 
     # functional calls for click events
     def handle_click(self, **kwargs):
@@ -1279,9 +1981,12 @@ class LeafletMap(HasTraits):
         else:
             self._ds.rio.write_crs(crs)
         # get the clicked point in dataset coordinate reference system
-        x, y = rio.warp.transform('EPSG:4326', crs, [lon], [lat])
+        transformer = self.get_transformer('EPSG:4326', crs)
+        x, y = transformer.transform(lon, lat)
         # find nearest point in dataset
-        self._data = self._ds_selected.sel(x=x, y=y, method='nearest').values[0]
+        ix = np.argmin(np.abs(self._ds_selected.x.values - x))
+        iy = np.argmin(np.abs(self._ds_selected.y.values - y))
+        self._data = self.get_values()[..., iy, ix]
         self._units = self._ds[self._variable].attrs['units']
         # only create popup if valid
         if np.isnan(self._data):
@@ -1319,28 +2024,41 @@ class LeafletMap(HasTraits):
         # remove any prior instances of a colorbar
         if self._colorbar is not None:
             self.remove(self._colorbar)
+        # create or reuse matplotlib figure for colorbar
+        if LeafletMap._colorbar_figure is None:
+            fig = matplotlib.figure.Figure()
+            matplotlib.backends.backend_agg.FigureCanvasAgg(fig)
+            LeafletMap._colorbar_figure = fig
+        fig = LeafletMap._colorbar_figure
+        # disconnect any prior colorbar from normalization callbacks
+        if LeafletMap._colorbar_base is not None:
+            mappable = LeafletMap._colorbar_base.mappable
+            mappable.callbacks.disconnect(mappable.colorbar_cid)
+            LeafletMap._colorbar_base = None
+        fig.clear()
+        fig.set_size_inches(kwargs['width'], kwargs['height'])
+        ax = fig.add_subplot()
         # create matplotlib colorbar
-        _, ax = plt.subplots(figsize=(kwargs['width'], kwargs['height']))
         cbar = matplotlib.colorbar.ColorbarBase(ax,
             cmap=kwargs['cmap'],
             norm=kwargs['norm'],
             alpha=kwargs['opacity'],
             orientation=kwargs['orientation'],
             label=kwargs['label'])
+        LeafletMap._colorbar_base = cbar
         cbar.solids.set_rasterized(True)
         cbar.ax.tick_params(which='both', width=1, direction='in')
         # save colorbar to in-memory png object
         png = io.BytesIO()
-        plt.savefig(png, bbox_inches='tight', pad_inches=0.075,
-            format='png', transparent=True)
-        png.seek(0)
+        fig.savefig(png, bbox_inches='tight', pad_inches=0.075,
+            format='png', transparent=True,
+            pil_kwargs=dict(compress_level=1, optimize=False))
         # create output widget
         output = ipywidgets.Image(value=png.getvalue(), format='png')
         self._colorbar = ipyleaflet.WidgetControl(widget=output,
             transparent_bg=False, position=kwargs['position'])
         # add colorbar
         self.add(self._colorbar)
-        plt.close()
 
     # save the current map as an image
     def imshow(self, ax=None, **kwargs):
@@ -1353,6 +2071,8 @@ class LeafletMap(HasTraits):
         kwargs: dict, default {}
             Additional keyword arguments for ``imshow``
         """
+        # import pyplot when first creating figures
+        import matplotlib.pyplot as plt
         # create figure axis if non-existent
         if (ax is None):
             _, ax = plt.subplots()
@@ -1414,8 +2134,10 @@ class TimeSeries(HasTraits):
         Units of selected variable
     _longname : str
         Unit longname of selected variable
-    _line : str
+    _line : obj
         Matplotlib line object from plot
+
+        ``LineCollection`` of all time steps for transects
     """
 
     def __init__(self, ds):
@@ -1435,6 +2157,12 @@ class TimeSeries(HasTraits):
         self._units = None
         self._longname = None
         self._line = None
+        # cache of valid grid cells and ice areas for each geometry
+        self._mask_cache = {}
+        # cache of sorted transect indices
+        self._transect_cache = {}
+        # contiguous coordinates of the dataset grid
+        self._grid_coords = None
 
     # create time series plot for a region
     def plot(self, feature,
@@ -1475,12 +2203,14 @@ class TimeSeries(HasTraits):
         self.crs = crs
         # attempt to get the coordinate reference system of the dataset
         self.get_crs()
+        # import pyplot when first creating figures
+        import matplotlib.pyplot as plt
         # set figure axis
         if ax is None:
             fig, ax = plt.subplots(figsize=figsize)
             fig.patch.set_facecolor('white')
         # reduce to variable
-        self._variable = copy.copy(variable)
+        self._variable = variable
         if (self._ds[self._variable].ndim == 3) and ('time' in self._ds[self._variable].dims):
             self._ds_selected = self._ds[self._variable]
         else:
@@ -1532,7 +2262,7 @@ class TimeSeries(HasTraits):
         # attempt to get the coordinate reference system of the dataset
         self.get_crs()
         # reduce to variable
-        self._variable = copy.copy(variable)
+        self._variable = variable
         if (self._ds[self._variable].ndim == 3) and ('time' in self._ds[self._variable].dims):
             self._ds_selected = self._ds[self._variable]
         else:
@@ -1592,14 +2322,13 @@ class TimeSeries(HasTraits):
         """
         # convert point to dataset coordinate reference system
         lon, lat = self.geometry['coordinates']
-        x, y = rio.warp.transform(self.crs, self._ds.rio.crs, [lon], [lat])
-        # output time series for point
-        self._data = np.zeros_like(self._ds.time)
-        # reduce dataset to geometry
-        for i, t in enumerate(self._ds.time):
-            self._data[i] = self._ds_selected.sel(x=x, y=y, time=t, method='nearest')
+        transformer = _transformer(self.crs, self._ds.rio.crs.to_wkt())
+        x, y = transformer.transform(lon, lat)
+        # reduce dataset to geometry and output time series for point
+        ts = self._ds_selected.sel(x=x, y=y, method='nearest')
+        self._data = np.asarray(ts.values).reshape(-1)
         # only create plot if valid
-        if np.all(np.isnan(self._data)):
+        if not np.isfinite(self._data).any():
             return
         # if only returning data
         if ax is None:
@@ -1630,6 +2359,127 @@ class TimeSeries(HasTraits):
         ax.xaxis.get_major_formatter().set_useOffset(False)
         return self
 
+    def get_ice_area(self, ds=None):
+        """Get the indices of valid grid cells within the geometry
+        and the ice area at each valid grid cell
+
+        Parameters
+        ----------
+        ds : obj or NoneType, default None
+            ``xarray.DataArray`` to extract at each valid grid cell
+
+            Loaded within the same computation as any uncached ice areas
+
+        Returns
+        -------
+        ii : np.ndarray
+            row indices of valid grid cells
+        jj : np.ndarray
+            column indices of valid grid cells
+        area : np.ndarray
+            ice area at each valid grid cell
+        values : np.ndarray or NoneType
+            values of ``ds`` at each valid grid cell
+        """
+        # use cached indices and ice areas for the geometry if available
+        key = (self.crs, json.dumps(self.geometry, sort_keys=True))
+        if key in self._mask_cache:
+            ii, jj, area = self._mask_cache[key]
+            values = None if ds is None else ds.isel(
+                y=xr.DataArray(ii, dims='point'),
+                x=xr.DataArray(jj, dims='point')
+            ).transpose(..., 'point').values
+            return (ii, jj, area, values)
+        # get ice area variable
+        if ('cell_area' in self._ds):
+            ice_area = self._ds['cell_area']
+        elif ('ice_area' in self._ds):
+            ice_area = self._ds['ice_area']
+        else:
+            raise NameError('No ice area variable in dataset')
+        # reduce ice area to a single band
+        if ('band' in ice_area.dims):
+            ice_area = ice_area.sel(band=1)
+        # indices of grid cells within the geometry
+        ii, jj = _geometry_index(self._ds, self.geometry, self.crs)
+        points = dict(y=xr.DataArray(ii, dims='point'),
+            x=xr.DataArray(jj, dims='point'))
+        # extract ice areas at each grid cell
+        # (time-variable for Release-02 and above)
+        area = ice_area.isel(**points).transpose(..., 'point')
+        values = None if ds is None else \
+            ds.isel(**points).transpose(..., 'point')
+        # load dask-backed areas and values within a single computation
+        if hasattr(dask, 'compute'):
+            area, values = dask.compute(area, values)
+        area = area.values
+        # reduce to grid cells with valid ice areas
+        valid = np.isfinite(area).reshape(-1, len(ii)).any(axis=0)
+        values = None if values is None else values.values[..., valid]
+        # remove the oldest cached indices and ice areas
+        # (only retaining the valid grid cells of each geometry)
+        if (len(self._mask_cache) >= 32):
+            self._mask_cache.pop(next(iter(self._mask_cache)))
+        self._mask_cache[key] = (ii[valid], jj[valid], area[..., valid])
+        return (*self._mask_cache[key], values)
+
+    def intersects(self):
+        """Check if the bounds of the geometry intersect the dataset
+        """
+        # convert geometry to dataset coordinate reference system
+        coords = list(_coordinates(self.geometry['coordinates']))
+        lon, lat = np.transpose(coords)
+        transformer = _transformer(self.crs, self._ds.rio.crs.to_wkt())
+        x, y = transformer.transform(lon, lat)
+        # check if bounding boxes are disjoint
+        xmin, ymin, xmax, ymax = self._ds.rio.bounds()
+        return not ((np.max(x) < xmin) or (np.min(x) > xmax) or
+            (np.max(y) < ymin) or (np.min(y) > ymax))
+
+    def get_grid_coords(self):
+        """Get the contiguous y and x coordinates of the dataset grid
+        """
+        if self._grid_coords is None:
+            y = np.ascontiguousarray(self._ds.y.values)
+            x = np.ascontiguousarray(self._ds.x.values)
+            self._grid_coords = (y, x)
+        return self._grid_coords
+
+    def get_transect_index(self, ii, jj, x0, y0, key=None):
+        """Get the order of valid grid cells sorted by distance
+        to the first point of a transect
+
+        Parameters
+        ----------
+        ii : np.ndarray
+            row indices of valid grid cells
+        jj : np.ndarray
+            column indices of valid grid cells
+        x0 : float
+            x-coordinate of first point in dataset reference system
+        y0 : float
+            y-coordinate of first point in dataset reference system
+        key : tuple or NoneType, default None
+            Additional key for the cached indices
+        """
+        # use cached indices for the geometry if available
+        key = (key, self.crs, json.dumps(self.geometry, sort_keys=True))
+        if key in self._transect_cache:
+            return self._transect_cache[key]
+        # get coordinates of each valid grid cell
+        y, x = self.get_grid_coords()
+        gridx = x[jj]
+        gridy = y[ii]
+        # calculate distances to first point in geometry
+        distance = np.hypot(gridx - x0, gridy - y0)
+        # sort grid cells by distance
+        indices = np.argsort(distance)
+        # remove the oldest cached indices
+        if (len(self._transect_cache) >= 32):
+            self._transect_cache.pop(next(iter(self._transect_cache)))
+        self._transect_cache[key] = (indices, distance[indices])
+        return self._transect_cache[key]
+
     def transect(self, ax, **kwargs):
         """Extracts and plots a time series for a transect
 
@@ -1643,87 +2493,94 @@ class TimeSeries(HasTraits):
             matplotlib colormap
         legend : bool, default False
             Add legend with time values
+        **kwargs : dict
+            Keyword arguments for ``matplotlib.collections.LineCollection``
+
+            Keywords for individual lines (e.g. ``marker``) are not supported
+
+        Returns
+        -------
+        self : obj
+            ``TimeSeries`` object with ``_line`` as a ``LineCollection``
         """
         # convert linestring to dataset coordinate reference system
         lon, lat = np.transpose(self.geometry['coordinates'])
-        x, y = rio.warp.transform(self.crs, self._ds.rio.crs, lon, lat)
-        # get coordinates of each grid cell
-        gridx, gridy = np.meshgrid(self._ds.x, self._ds.y)
-        # clip ice area to geometry
-        if ('cell_area' in self._ds):
-            ice_area = self._ds['cell_area'].rio.clip([self.geometry], self.crs, drop=False)
-        elif ('ice_area' in self._ds):
-            ice_area = self._ds['ice_area'].rio.clip([self.geometry], self.crs, drop=False)
-        else:
-            raise NameError('No ice area variable in dataset')
-        # create valid mask from ice area
-        if (ice_area.ndim == 3) and ('band' in ice_area.dims):
-            mask = np.isfinite(ice_area.sel(band=1))
-        elif (ice_area.ndim == 3) and ('time' in ice_area.dims):
-            mask = np.isfinite(ice_area).any(dim='time')
-        elif (ice_area.ndim == 2):
-            mask = np.isfinite(ice_area)
+        transformer = _transformer(self.crs, self._ds.rio.crs.to_wkt())
+        x, y = transformer.transform(lon, lat)
+        # skip if the geometry does not overlap the dataset
+        if not self.intersects():
+            return
+        # indices of valid grid cells within the geometry
+        ii, jj, area, _ = self.get_ice_area()
         # only create plot if valid
-        if np.all(np.logical_not(mask)):
+        if not ii.size:
             return
-        # valid values in mask
-        ii, jj = np.nonzero(mask)
-        # calculate distances to first point in geometry
-        distance = np.sqrt((gridx[mask] - x[0])**2 + (gridy[mask] - y[0])**2)
-        # sort output data by distance
-        indices = np.argsort(distance)
-        self._dist = distance[indices]
+        # valid grid cells sorted by distance to first point
+        # (so values are extracted in order of distance)
+        indices, self._dist = self.get_transect_index(ii, jj, x[0], y[0])
+        ii, jj = (ii[indices], jj[indices])
         # output reduced time series for each point
-        self._data = np.zeros((np.count_nonzero(mask), len(self._ds.time)))
-        labels = [None]*len(self._ds.time)
-        # for each step in the time series
-        for i, t in enumerate(self._ds.time):
-            clipped = self._ds_selected.sel(time=t).where(mask, drop=False)
-            reduced = clipped.chunk(dict(y=-1,x=-1)).values[ii, jj]
-            # sort data based on distance to first point
-            self._data[:, i] = reduced[indices]
-            labels[i] = '{0:0.2f}'.format(self._time[i].data)
+        # extracting all steps in the time series at once
+        reduced = self._ds_selected.isel(
+            y=xr.DataArray(ii, dims='point'),
+            x=xr.DataArray(jj, dims='point')
+        ).transpose('time', 'point').values
+        # downcast to single precision for display
+        reduced = np.ascontiguousarray(reduced, dtype=np.float32)
+        # output with contiguous columns for each time step
+        self._data = reduced.T
+        labels = np.char.mod('%0.2f', np.asarray(self._time)).tolist()
         # only create plot if valid
-        if np.all(np.isnan(self._data)):
+        if not np.isfinite(self._data).any():
             return
         # if only returning data
         if ax is None:
             return self
+        # number of steps in the time series
+        nt = len(self._ds.time)
         # get colormap for each time point
         if ('cmap' in kwargs.keys()):
-            cmap = copy.copy(plt.cm.get_cmap(kwargs['cmap']))
-            # create iterable plot colors for color map
-            plot_colors = iter(cmap(np.linspace(0, 1, len(self._ds.time))))
-            kwargs.pop('cmap')
-        else:
-            plot_colors = None
+            cmap = _colormap(kwargs.pop('cmap'))
+            kwargs['colors'] = cmap(np.linspace(0, 1, nt))
+        elif not {'color', 'colors'}.intersection(kwargs.keys()):
+            # use colors from the property cycle
+            cycle = matplotlib.rcParams['axes.prop_cycle'].by_key()
+            kwargs['colors'] = cycle.get('color', ['C0'])
         # create legend for time values
         if ('legend' in kwargs.keys()):
             add_legend = True
             kwargs.pop('legend')
         else:
             add_legend = False
-        # output time series plot
-        self._line = [None]*len(self._ds.time)
-        # for each step in the time series
-        for i, t in enumerate(self._ds.time):
-            # select color
-            if (plot_colors is not None):
-                kwargs['color'] = next(plot_colors)
-            # create transect plot
-            self._line[i], = ax.plot(self._dist, self._data[:,i],
-                label=labels[i], **kwargs)
+        # verify keyword arguments are supported by line collections
+        # (such as markers and draw styles for individual lines)
+        invalid = [key for key in kwargs.keys() if not
+            hasattr(matplotlib.collections.LineCollection, f'set_{key}')]
+        if invalid:
+            raise ValueError(f'Unsupported keyword arguments for '
+                f'LineCollection: {", ".join(invalid)}')
+        # line segments for each step in the time series
+        segments = np.empty((nt, len(self._dist), 2))
+        segments[..., 0] = self._dist
+        segments[..., 1] = self._data.T
+        # create transect plot with a single collection of lines
+        self._line = matplotlib.collections.LineCollection(segments,
+            **kwargs)
+        ax.add_collection(self._line)
+        ax.autoscale_view()
         # set labels and title
         ax.set_xlabel('{0} [{1}]'.format('Distance', 'm'))
         ax.set_ylabel('{0} [{1}]'.format(self._longname, self._units))
         ax.set_title(self._variable)
-        # create legend
+        # create legend with proxy lines for each time
         if add_legend:
-            lgd = ax.legend(loc=2, frameon=False,
+            colors = self._line.get_colors()
+            handles = [matplotlib.lines.Line2D([], [], linewidth=6,
+                color=colors[i % len(colors)], label=label)
+                for i, label in enumerate(labels)]
+            lgd = ax.legend(handles=handles, loc=2, frameon=False,
                 bbox_to_anchor=(1.025, 1),
                 borderaxespad=0.0)
-            for line in lgd.get_lines():
-                line.set_linewidth(6)
         # set axis ticks to not use constant offset
         ax.xaxis.get_major_formatter().set_useOffset(False)
         return self
@@ -1740,22 +2597,14 @@ class TimeSeries(HasTraits):
         legend : bool, default False
             Add legend
         """
-        # clip ice area to geometry
-        if ('cell_area' in self._ds):
-            ice_area = self._ds['cell_area'].rio.clip([self.geometry], self.crs, drop=False)
-        elif ('ice_area' in self._ds):
-            ice_area = self._ds['ice_area'].rio.clip([self.geometry], self.crs, drop=False)
-        else:
-            raise NameError('No ice area variable in dataset')
-        # create valid mask from ice area
-        if (ice_area.ndim == 3) and ('band' in ice_area.dims):
-            mask = np.isfinite(ice_area.sel(band=1))
-        elif (ice_area.ndim == 3) and ('time' in ice_area.dims):
-            mask = np.isfinite(ice_area).any(dim='time')
-        elif (ice_area.ndim == 2):
-            mask = np.isfinite(ice_area)
+        # skip if the geometry does not overlap the dataset
+        if not self.intersects():
+            return
+        # extract ice areas and values for all times at each valid
+        # grid cell (loading dask-backed data in a single computation)
+        ii, jj, area, values = self.get_ice_area(self._ds_selected)
         # only create plot if valid
-        if np.all(np.logical_not(mask)):
+        if not ii.size:
             return
         # list of optional error variables
         error_variables = ('delta_h_sigma',
@@ -1763,27 +2612,28 @@ class TimeSeries(HasTraits):
             'misfit_rms_scaled',
             'dhdt_sigma'
         )
-        # output average time series
-        self._data = np.zeros_like(self._ds.time)
-        self._area = np.zeros_like(self._ds.time)
-        # reduce dataset to geometry
-        for i, t in enumerate(self._ds.time):
-            # reduce data to time and clip to geometry
-            clipped = self._ds_selected.sel(time=t).where(mask, drop=False)
-            # reduce cell area to time (for Release-02 and above)
-            if (ice_area.ndim == 3) and ('time' in ice_area.dims):
-                area = ice_area.sel(time=t)
-            else:
-                area = ice_area.copy()
-            # calculate regional average
-            if self._variable in error_variables:
-                self._data[i] = np.sqrt(np.sum(area*clipped**2)/np.sum(area))
-            else:
-                self._data[i] = np.sum(area*clipped)/np.sum(area)
-            # calculate total area for region
-            self._area[i] = np.sum(area)
+        # broadcast cell areas to the shape of the values
+        area = np.broadcast_to(area, values.shape)
+        # calculate area-weighted sums and total area for region
+        squared = (self._variable in error_variables)
+        if _area_weighted_sums is not None:
+            weighted, self._area = _area_weighted_sums(area, values, squared)
+        else:
+            # remove invalid values from the weighted sums
+            area = np.nan_to_num(area)
+            values = np.where(np.isfinite(values), values, 0.0)
+            if squared:
+                values *= values
+            self._area = area.sum(axis=1, dtype=np.float64)
+            weighted = np.einsum('ij,ij->i', area, values)
+        # calculate regional average time series
+        # (downcasting to single precision for display)
+        self._data = weighted/self._area
+        if squared:
+            self._data = np.sqrt(self._data)
+        self._data = self._data.astype(np.float32)
         # only create plot if valid
-        if np.all(np.isnan(self._data)):
+        if not np.isfinite(self._data).any():
             return
         # if only returning data
         if ax is None:
@@ -1863,6 +2713,11 @@ class Transect(HasTraits):
         self._units = None
         self._longname = None
         self._line = None
+        # cache of grid cells within geometries and sorted transect indices
+        self._mask_cache = {}
+        self._transect_cache = {}
+        # contiguous coordinates of the dataset grid
+        self._grid_coords = None
 
     # create plot for a transect
     def plot(self, feature,
@@ -1903,12 +2758,14 @@ class Transect(HasTraits):
         self.crs = crs
         # attempt to get the coordinate reference system of the dataset
         self.get_crs()
+        # import pyplot when first creating figures
+        import matplotlib.pyplot as plt
         # set figure axis
         if ax is None:
             fig, ax = plt.subplots(figsize=figsize)
             fig.patch.set_facecolor('white')
         # reduce to variable
-        self._variable = copy.copy(variable)
+        self._variable = variable
         if (self._ds[self._variable].ndim == 3) and ('time' in self._ds[self._variable].dims):
             self._ds_selected = self._ds[self._variable].sel(time=self._ds.time[lag])
         elif (self._ds[self._variable].ndim == 3) and ('band' in self._ds[self._variable].dims):
@@ -1958,7 +2815,7 @@ class Transect(HasTraits):
         # attempt to get the coordinate reference system of the dataset
         self.get_crs()
         # reduce to variable
-        self._variable = copy.copy(variable)
+        self._variable = variable
         if (self._ds[self._variable].ndim == 3) and ('time' in self._ds[self._variable].dims):
             self._ds_selected = self._ds[self._variable].sel(time=self._ds.time[lag])
         elif (self._ds[self._variable].ndim == 3) and ('band' in self._ds[self._variable].dims):
@@ -2000,6 +2857,77 @@ class Transect(HasTraits):
         # raise exception
         raise Exception('Unknown coordinate reference system')
 
+    def intersects(self):
+        """Check if the bounds of the geometry intersect the dataset
+        """
+        # convert geometry to dataset coordinate reference system
+        coords = list(_coordinates(self.geometry['coordinates']))
+        lon, lat = np.transpose(coords)
+        transformer = _transformer(self.crs, self._ds.rio.crs.to_wkt())
+        x, y = transformer.transform(lon, lat)
+        # check if bounding boxes are disjoint
+        xmin, ymin, xmax, ymax = self._ds.rio.bounds()
+        return not ((np.max(x) < xmin) or (np.min(x) > xmax) or
+            (np.max(y) < ymin) or (np.min(y) > ymax))
+
+    def get_grid_coords(self):
+        """Get the contiguous y and x coordinates of the dataset grid
+        """
+        if self._grid_coords is None:
+            y = np.ascontiguousarray(self._ds.y.values)
+            x = np.ascontiguousarray(self._ds.x.values)
+            self._grid_coords = (y, x)
+        return self._grid_coords
+
+    def get_geometry_index(self):
+        """Get the indices of grid cells within the geometry
+        """
+        # use cached indices if available
+        key = (self.crs, json.dumps(self.geometry, sort_keys=True))
+        if key in self._mask_cache:
+            return self._mask_cache[key]
+        # remove the oldest cached indices
+        if (len(self._mask_cache) >= 32):
+            self._mask_cache.pop(next(iter(self._mask_cache)))
+        self._mask_cache[key] = _geometry_index(self._ds,
+            self.geometry, self.crs)
+        return self._mask_cache[key]
+
+    def get_transect_index(self, ii, jj, x0, y0, key=None):
+        """Get the order of valid grid cells sorted by distance
+        to the first point of a transect
+
+        Parameters
+        ----------
+        ii : np.ndarray
+            row indices of valid grid cells
+        jj : np.ndarray
+            column indices of valid grid cells
+        x0 : float
+            x-coordinate of first point in dataset reference system
+        y0 : float
+            y-coordinate of first point in dataset reference system
+        key : tuple or NoneType, default None
+            Additional key for the cached indices
+        """
+        # use cached indices for the geometry if available
+        key = (key, self.crs, json.dumps(self.geometry, sort_keys=True))
+        if key in self._transect_cache:
+            return self._transect_cache[key]
+        # get coordinates of each valid grid cell
+        y, x = self.get_grid_coords()
+        gridx = x[jj]
+        gridy = y[ii]
+        # calculate distances to first point in geometry
+        distance = np.hypot(gridx - x0, gridy - y0)
+        # sort grid cells by distance
+        indices = np.argsort(distance)
+        # remove the oldest cached indices
+        if (len(self._transect_cache) >= 32):
+            self._transect_cache.pop(next(iter(self._transect_cache)))
+        self._transect_cache[key] = (indices, distance[indices])
+        return self._transect_cache[key]
+
     def transect(self, ax, **kwargs):
         """Extracts and plots a transect
 
@@ -2014,28 +2942,29 @@ class Transect(HasTraits):
         """
         # convert linestring to dataset coordinate reference system
         lon, lat = np.transpose(self.geometry['coordinates'])
-        x, y = rio.warp.transform(self.crs, self._ds.rio.crs, lon, lat)
-        # get coordinates of each grid cell
-        gridx, gridy = np.meshgrid(self._ds.x, self._ds.y)
-        # clip variable to geometry and create mask
-        clipped = self._ds_selected.rio.clip([self.geometry], self.crs, drop=False)
-        mask = np.isfinite(clipped)
-        # only create plot if valid
-        if np.all(np.logical_not(mask)):
+        transformer = _transformer(self.crs, self._ds.rio.crs.to_wkt())
+        x, y = transformer.transform(lon, lat)
+        # skip if the geometry does not overlap the dataset
+        if not self.intersects():
             return
-        # valid values in mask
-        ii, jj = np.nonzero(mask)
-        # calculate distances to first point in geometry
-        distance = np.sqrt((gridx[mask] - x[0])**2 + (gridy[mask] - y[0])**2)
-        # sort output data by distance
-        indices = np.argsort(distance)
-        self._dist = distance[indices]
-        # sort data based on distance to first point
-        reduced = clipped.chunk(dict(y=-1,x=-1)).values[ii, jj]
-        self._data = reduced[indices]
+        # extract values at each grid cell within the geometry
+        # (reusing the rasterized geometry rather than clipping)
+        ii, jj = self.get_geometry_index()
+        values = self._ds_selected.isel(
+            y=xr.DataArray(ii, dims='point'),
+            x=xr.DataArray(jj, dims='point')
+        ).values
+        valid = np.isfinite(values)
         # only create plot if valid
-        if np.all(np.isnan(self._data)):
+        if not valid.any():
             return
+        # valid values sorted by distance to first point
+        # (valid cells are specific to the variable and time)
+        time = self._ds_selected.coords.get('time')
+        key = (self._variable, None if time is None else time.item())
+        indices, self._dist = self.get_transect_index(ii[valid], jj[valid],
+            x[0], y[0], key=key)
+        self._data = values[valid][indices]
         # if only returning data
         if ax is None:
             return self
@@ -1,6 +1,6 @@
 """
 io.py
-Written by Tyler Sutterley (06/2024)
+Written by Tyler Sutterley (10/2026)
 Utilities for reading gridded ICESat-2 files using rasterio and xarray
 
 PYTHON DEPENDENCIES:
@@ -18,6 +18,7 @@ PYTHON DEPENDENCIES:
         https://docs.xarray.dev/en/stable/
 
 UPDATE HISTORY:
+    Updated 10/2026: align dask chunks with the internal tiles of files
     Updated 06/2024: use wrapper to importlib for optional dependencies
     Updated 10/2023: use dask.delayed to read multiple files in parallel
     Updated 08/2023: use xarray h5netcdf to read files streaming from s3
@@ -164,6 +165,9 @@ def from_rasterio(granule,
     ds: object
         ``xarray`` dataset
     """
+    # align dask chunks with the internal tiles of the file
+    if hasattr(dask, 'compute'):
+        kwargs.setdefault('chunks', True)
     ds = rioxarray.open_rasterio(granule,
         group=group,
         masked=True,
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 u"""
 tools.py
-Written by Tyler Sutterley (01/2025)
+Written by Tyler Sutterley (10/2026)
 User interface tools for Jupyter Notebooks
 
 PYTHON DEPENDENCIES:
@@ -17,6 +17,9 @@ PYTHON DEPENDENCIES:
         https://matplotlib.org/cmocean/
 
 UPDATE HISTORY:
+    Updated 10/2026: use module-level sets of time-invariant parameters
+        only observe changes in the values of widgets
+        return None for normalization ranges if dynamically set
     Updated 01/2025: added optional cmocean colormaps to dropdown menu
         updated the default group list to include lags for release 004
     Updated 06/2024: use wrapper to importlib for optional dependencies
@@ -43,6 +46,10 @@ cmocean = import_dependency('cmocean')
 # set environmental variable for anonymous s3 access
 os.environ['AWS_NO_SIGN_REQUEST'] = 'YES'
 
+# time-invariant parameters for Release-01 and Release-02+
+_INVARIANT_PRE_R2 = frozenset({'ice_mask', 'cell_area'})
+_INVARIANT_POST_R2 = frozenset({'ice_mask'})
+
 class widgets:
     def __init__(self, **kwargs):
         # set default keyword options
@@ -199,12 +206,12 @@ class widgets:
         )
 
         # watch widgets for changes
-        self.asset.observe(self.set_directory_visibility)
-        self.asset.observe(self.set_format_visibility)
-        self.release.observe(self.set_groups)
-        self.dynamic.observe(self.set_dynamic)
-        self.variable.observe(self.set_time_visibility)
-        self.timestep.observe(self.set_lag)
+        self.asset.observe(self.set_directory_visibility, names='value')
+        self.asset.observe(self.set_format_visibility, names='value')
+        self.release.observe(self.set_groups, names='value')
+        self.dynamic.observe(self.set_dynamic, names='value')
+        self.variable.observe(self.set_time_visibility, names='value')
+        self.timestep.observe(self.set_lag, names='value')
 
         # slider for normalization range
         self.range = ipywidgets.FloatRangeSlider(
@@ -346,14 +353,16 @@ class widgets:
     @property
     def vmin(self):
         """return minimum of normalization range
+        (``None`` if dynamically set)
         """
-        return self.range.value[0]
+        return None if self.dynamic.value else self.range.value[0]
 
     @property
     def vmax(self):
         """return maximum of normalization range
+        (``None`` if dynamically set)
         """
-        return self.range.value[1]
+        return None if self.dynamic.value else self.range.value[1]
 
     def set_directory_visibility(self, sender):
         """updates the visibility of the directory widget
@@ -516,10 +525,11 @@ class widgets:
     def set_time_visibility(self, sender):
         """updates the visibility of the time widget
         """
-        # list of invariant parameters
-        invariant_parameters = ['ice_mask']
+        # set of invariant parameters for release
         if (int(self.release.value) <= 1):
-            invariant_parameters.append('cell_area')
+            invariant_parameters = _INVARIANT_PRE_R2
+        else:
+            invariant_parameters = _INVARIANT_POST_R2
         # check if setting an invariant variable
         if self.variable.value in invariant_parameters:
             self.timestep.layout.display = 'none'